@@ -1 +1,37 @@
-"""Core orchestration runtime for the LLM Agent PoC."""
+"""Core orchestration runtime for the LLM Agent PoC.
+
+The public classes are re-exported lazily (PEP 562) so that ``import core``
+stays cheap: jinja2 and the orchestrator machinery are only imported when the
+corresponding attribute is first accessed.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from .llm import LocalLLMClient
+    from .orchestrator import PipelineRunner
+    from .pipeline_loader import PipelineLoader
+    from .prompt_service import PromptService
+
+_LAZY_MAP = {
+    "PipelineRunner": ("core.orchestrator", "PipelineRunner"),
+    "PipelineLoader": ("core.pipeline_loader", "PipelineLoader"),
+    "PromptService": ("core.prompt_service", "PromptService"),
+    "LocalLLMClient": ("core.llm", "LocalLLMClient"),
+}
+
+__all__ = list(_LAZY_MAP)
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY_MAP[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    setattr(sys.modules[__name__], name, value)
+    return value
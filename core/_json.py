@@ -0,0 +1,37 @@
+"""JSON helpers with an optional orjson fast path.
+
+orjson parses and serialises JSON several times faster than the stdlib, but it
+is not a hard dependency of the PoC. These helpers pick it up when installed
+and fall back to stdlib ``json`` otherwise. ``loads`` accepts bytes (skipping
+the text-IO decode layer) and ``dumps`` returns indented UTF-8 bytes either
+way, so callers can use ``Path.read_bytes``/``Path.write_bytes`` directly.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    import orjson
+
+    def _default(obj: Any) -> Any:
+        # orjson refuses tuple subclasses (e.g. NamedTuple step outputs);
+        # render them as arrays for parity with stdlib json.
+        if isinstance(obj, tuple):
+            return list(obj)
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+    def loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=_default)
+
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    import json
+
+    def loads(data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
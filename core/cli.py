@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import argparse
+import sys
 from pathlib import Path
 from typing import Iterable
 
-from .orchestrator import PipelineRunner
-from .pipeline_loader import PipelineLoader
+_SUBCOMMANDS = ("list", "run", "visualize")
 
 
 def _parse_params(values: Iterable[str]) -> dict[str, str]:
@@ -26,6 +26,8 @@ def _parse_params(values: Iterable[str]) -> dict[str, str]:
 
 
 def _cmd_list_pipelines(_: argparse.Namespace) -> int:
+    from .pipeline_loader import PipelineLoader
+
     loader = PipelineLoader()
     pipelines = loader.list_pipelines()
     if not pipelines:
@@ -41,6 +43,9 @@ def _cmd_list_pipelines(_: argparse.Namespace) -> int:
 
 
 def _cmd_run_pipeline(args: argparse.Namespace) -> int:
+    from .orchestrator import PipelineRunner
+    from .pipeline_loader import PipelineLoader
+
     loader = PipelineLoader()
     pipeline_def = loader.load(args.pipeline)
     try:
@@ -63,15 +68,12 @@ def _cmd_visualize(_: argparse.Namespace) -> int:
     return 0
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        description="Run local LLM pipelines without any web services.",
-    )
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
+def _add_list_parser(subparsers: argparse._SubParsersAction) -> None:
     list_parser = subparsers.add_parser("list", help="Show available pipelines")
     list_parser.set_defaults(func=_cmd_list_pipelines)
 
+
+def _add_run_parser(subparsers: argparse._SubParsersAction) -> None:
     run_parser = subparsers.add_parser("run", help="Execute a pipeline with the provided inputs")
     run_parser.add_argument("pipeline", help="Pipeline name or JSON path")
     run_parser.add_argument(
@@ -91,17 +93,56 @@ def build_parser() -> argparse.ArgumentParser:
     )
     run_parser.set_defaults(func=_cmd_run_pipeline)
 
+
+def _add_visualize_parser(subparsers: argparse._SubParsersAction) -> None:
     visualize_parser = subparsers.add_parser(
         "visualize",
         help="Launch a GUI to inspect prompts and step dependencies",
     )
     visualize_parser.set_defaults(func=_cmd_visualize)
 
+
+_SUBCOMMAND_BUILDERS = {
+    "list": _add_list_parser,
+    "run": _add_run_parser,
+    "visualize": _add_visualize_parser,
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Peek at the first non-flag token to find the requested subcommand.
+
+    Building every subparser just to dispatch a single command is wasted work,
+    so when the subcommand is recognisable up front only its branch gets built.
+    Returns ``None`` when no known subcommand is present (e.g. bare ``--help``),
+    in which case the caller should fall back to the full parser.
+    """
+
+    for token in argv:
+        if not token.startswith("-"):
+            return token if token in _SUBCOMMANDS else None
+    return None
+
+
+def build_parser(only: str | None = None) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Run local LLM pipelines without any web services.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    if only in _SUBCOMMAND_BUILDERS:
+        _SUBCOMMAND_BUILDERS[only](subparsers)
+    else:
+        for builder in _SUBCOMMAND_BUILDERS.values():
+            builder(subparsers)
+
     return parser
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = build_parser(only=_sniff_subcommand(argv))
     args = parser.parse_args(argv)
     return args.func(args)
 
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import importlib
-import json
+import os
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+from ._json import dumps as _dumps
 from .llm import LocalLLMClient
 from .prompt_service import PromptService
 
@@ -29,15 +29,24 @@ class PipelineRunner:
         self.artifacts_dir = artifacts_dir or Path(__file__).resolve().parent.parent / "artifacts"
         self.prompt_service = prompt_service or PromptService()
         self.llm_client = llm_client or LocalLLMClient()
+        self._ref_cache: dict[str, Callable[[dict[str, Any]], Any]] = {}
+        self._transform_cache: dict[str, Callable[..., Any]] = {}
+        # Keyed by id(step); the step dict is kept in the value so the id
+        # cannot be recycled while the cache entry is alive.
+        self._output_mapper_cache: dict[int, tuple[dict[str, Any], dict[str, Callable[[Any], Any]]]] = {}
         self.artifacts_dir.mkdir(parents=True, exist_ok=True)
 
     def run(self, pipeline: dict[str, Any], inputs: dict[str, Any]) -> dict[str, Any]:
-        run_id = datetime.utcnow().strftime("%Y%m%d-%H%M%S-%f")
+        # Run ids only need to be unique and sortable; building them from
+        # time.time_ns avoids a datetime allocation (and the deprecated
+        # datetime.utcnow) while keeping the same UTC timestamp format.
+        seconds, remainder_ns = divmod(time.time_ns(), 1_000_000_000)
+        run_id = time.strftime("%Y%m%d-%H%M%S", time.gmtime(seconds)) + f"-{remainder_ns // 1000:06d}"
         run_dir = self.artifacts_dir / f"run-{run_id}"
         run_dir.mkdir(parents=True, exist_ok=True)
 
         context: dict[str, Any] = {"inputs": inputs, "steps": {}}
-        step_results: list[StepResult] = []
+        manifest_steps: list[dict[str, Any]] = []
 
         for step in pipeline.get("steps", []):
             step_id = step["id"]
@@ -52,24 +61,31 @@ class PipelineRunner:
                 raise ValueError(f"Unsupported step type: {step_type}")
 
             context["steps"][step_id] = result.outputs
-            step_results.append(result)
+            # Append the manifest entry directly instead of materialising a
+            # parallel StepResult list and re-walking it afterwards.
+            manifest_steps.append(
+                {
+                    "id": result.id,
+                    "type": result.type,
+                    "outputs": result.outputs,
+                    "metadata": result.metadata,
+                }
+            )
 
         run_manifest = {
             "run_id": run_id,
             "pipeline": pipeline.get("name"),
             "inputs": inputs,
-            "steps": [
-                {
-                    "id": r.id,
-                    "type": r.type,
-                    "outputs": r.outputs,
-                    "metadata": r.metadata,
-                }
-                for r in step_results
-            ],
+            "steps": manifest_steps,
         }
-        with (run_dir / "run.json").open("w", encoding="utf-8") as f:
-            json.dump(run_manifest, f, indent=2)
+        # One serialisation, one syscall: write the pre-encoded manifest
+        # through a raw fd rather than a buffered file object.
+        payload = _dumps(run_manifest)
+        fd = os.open(run_dir / "run.json", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
 
         return {"run_id": run_id, "artifacts_path": str(run_dir), "steps": run_manifest["steps"]}
 
@@ -86,16 +102,13 @@ class PipelineRunner:
         prompt = self.prompt_service.render(prompt_template, variables)
         params = step.get("params", {})
         llm_response = self.llm_client.complete(prompt, **params)
-        output_mappings = step.get("outputs", {"content": "content"})
-        mapped_outputs: dict[str, Any] = {}
-        for target, source in output_mappings.items():
-            if source == "content":
-                mapped_outputs[target] = llm_response.content
-            elif source.startswith("metadata."):
-                _, _, key = source.partition(".")
-                mapped_outputs[target] = llm_response.usage.get(key)
-            else:
-                raise ValueError(f"Unsupported llm_call output source '{source}'")
+        cached = self._output_mapper_cache.get(id(step))
+        if cached is None:
+            mappers = self._compile_output_mappers(step.get("outputs", {"content": "content"}))
+            self._output_mapper_cache[id(step)] = (step, mappers)
+        else:
+            mappers = cached[1]
+        mapped_outputs = {target: mapper(llm_response) for target, mapper in mappers.items()}
         return StepResult(
             id=step["id"],
             type=step["type"],
@@ -103,14 +116,38 @@ class PipelineRunner:
             metadata={"usage": llm_response.usage},
         )
 
+    def _compile_output_mappers(
+        self, mappings: dict[str, str]
+    ) -> dict[str, Callable[[Any], Any]]:
+        """Turn llm_call output mappings into response-extracting callables.
+
+        Compiling the mapping once per step removes the per-output string
+        prefix checks from every invocation of a hot llm_call step.
+        """
+
+        mappers: dict[str, Callable[[Any], Any]] = {}
+        for target, source in mappings.items():
+            if source == "content":
+                mappers[target] = lambda response: response.content
+            elif source.startswith("metadata."):
+                key = source[len("metadata."):]
+                mappers[target] = lambda response, _key=key: response.usage.get(_key)
+            else:
+                raise ValueError(f"Unsupported llm_call output source '{source}'")
+        return mappers
+
     def _run_transform_step(self, step: dict[str, Any], context: dict[str, Any]) -> StepResult:
         code = step.get("code")
         if not code or not code.startswith("python:"):
             raise ValueError("Transform steps currently support python:<module>.<callable>")
-        _, target = code.split(":", 1)
-        module_path, func_name = target.rsplit(".", 1)
-        module = importlib.import_module(module_path)
-        func = getattr(module, func_name)
+        func = self._transform_cache.get(code)
+        if func is None:
+            import importlib
+
+            _, target = code.split(":", 1)
+            module_path, func_name = target.rsplit(".", 1)
+            func = getattr(importlib.import_module(module_path), func_name)
+            self._transform_cache[code] = func
 
         call_inputs = self._resolve_inputs(step.get("inputs", {}), context)
         result = func(**call_inputs)
@@ -135,20 +172,37 @@ class PipelineRunner:
             resolved[key] = self._resolve_reference(ref, context)
         return resolved
 
+    def _compile_ref(self, reference: str) -> Callable[[dict[str, Any]], Any]:
+        """Compile a dotted reference into a closure over its parsed parts.
+
+        References are re-resolved for every step invocation, so splitting and
+        branching on the string each time adds up; compiling once per unique
+        reference keeps the per-lookup work to plain attribute traversal.
+        """
+
+        root, *rest = reference.split(".")
+        parts = tuple(rest)
+        if root == "inputs":
+            def resolve(context: dict[str, Any]) -> Any:
+                value: Any = context["inputs"]
+                for part in parts:
+                    value = value[part]
+                return value
+        else:
+            def resolve(context: dict[str, Any]) -> Any:
+                value: Any = context["steps"].get(root, {})
+                for part in parts:
+                    if isinstance(value, dict):
+                        value = value.get(part)
+                    elif isinstance(value, list):
+                        value = value[int(part)]
+                    else:
+                        raise KeyError(f"Cannot traverse {reference}")
+                return value
+        return resolve
+
     def _resolve_reference(self, reference: str, context: dict[str, Any]) -> Any:
-        parts = reference.split(".")
-        if parts[0] == "inputs":
-            value: Any = context["inputs"]
-            for part in parts[1:]:
-                value = value[part]
-            return value
-        step_id = parts[0]
-        value: Any = context["steps"].get(step_id, {})
-        for part in parts[1:]:
-            if isinstance(value, dict):
-                value = value.get(part)
-            elif isinstance(value, list):
-                value = value[int(part)]
-            else:
-                raise KeyError(f"Cannot traverse {reference}")
-        return value
+        resolver = self._ref_cache.get(reference)
+        if resolver is None:
+            resolver = self._ref_cache.setdefault(reference, self._compile_ref(reference))
+        return resolver(context)
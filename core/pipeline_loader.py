@@ -1,25 +1,61 @@
 from __future__ import annotations
 
+import os
+import threading
 from pathlib import Path
 from typing import Any
-import json
+
+from ._json import loads as _loads
 
 class PipelineLoader:
     """Loads pipeline definitions stored as JSON files."""
 
     def __init__(self, base_dir: Path | None = None) -> None:
         self.base_dir = base_dir or Path(__file__).resolve().parent.parent / "pipelines"
+        # Parsed definitions keyed by path, invalidated on mtime change. The
+        # lock keeps the cache safe for concurrent callers sharing a loader.
+        self._cache: dict[str, tuple[int, dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
+
+    def _load_cached(self, key: str, mtime_ns: int) -> dict[str, Any]:
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+        with open(key, "rb") as f:
+            data = _loads(f.read())
+        with self._cache_lock:
+            self._cache[key] = (mtime_ns, data)
+        return data
+
+    def _load_path(self, path: Path) -> dict[str, Any]:
+        return self._load_cached(str(path), path.stat().st_mtime_ns)
 
     def list_pipelines(self) -> list[dict[str, Any]]:
+        # A single scandir pass gives us names and stat results without
+        # building Path objects or issuing one stat syscall per file.
+        try:
+            with os.scandir(self.base_dir) as it:
+                entries = sorted(
+                    (e for e in it if e.name.endswith(".json") and e.is_file()),
+                    key=lambda e: e.name,
+                )
+        except FileNotFoundError:
+            # Match the old Path.glob behaviour: a missing pipelines
+            # directory just means there are no pipelines yet.
+            return []
+
         pipelines: list[dict[str, Any]] = []
-        for path in sorted(self.base_dir.glob("*.json")):
-            with path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+        for entry in entries:
+            data = self._load_cached(entry.path, entry.stat().st_mtime_ns)
             pipelines.append({
-                "name": data.get("name", path.stem),
-                "path": str(path),
+                "name": data.get("name", entry.name[:-len(".json")]),
+                "path": entry.path,
                 "description": data.get("description", ""),
                 "inputs": data.get("inputs", {}),
+                # Full parsed definition, so list-then-run flows don't have
+                # to go back through load() for a file we just parsed.
+                "definition": data,
             })
         return pipelines
 
@@ -29,5 +65,4 @@ class PipelineLoader:
             path = self.base_dir / f"{name_or_path}.json"
         if not path.exists():
             raise FileNotFoundError(f"Pipeline '{name_or_path}' not found in {self.base_dir}")
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return self._load_path(path)
@@ -3,21 +3,40 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
 
 class PromptService:
     """Loads and renders Jinja2 templates for prompts."""
 
     def __init__(self, templates_dir: Path | None = None) -> None:
         self.templates_dir = templates_dir or Path(__file__).resolve().parent.parent / "templates"
-        self.env = Environment(
-            loader=FileSystemLoader(self.templates_dir),
-            autoescape=select_autoescape(enabled_extensions=("j2", "jinja2"), default=False),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self._env = None
+        self._template_cache: dict[str, Any] = {}
+
+    def _get_env(self):
+        """Build the Jinja2 environment on first use.
+
+        Importing jinja2 is deferred so that code paths that never render a
+        prompt (listing pipelines, visualising) skip the import entirely.
+        """
+
+        if self._env is None:
+            from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+            self._env = Environment(
+                loader=FileSystemLoader(self.templates_dir),
+                autoescape=select_autoescape(enabled_extensions=("j2", "jinja2"), default=False),
+                trim_blocks=True,
+                lstrip_blocks=True,
+                auto_reload=False,
+            )
+        return self._env
 
     def render(self, template_path: str, variables: dict[str, Any]) -> str:
-        template = self.env.get_template(template_path)
+        # Compiled templates are cached per path so repeat renders skip the
+        # FileSystemLoader lookup (and its os.stat freshness check) entirely.
+        template = self._template_cache.get(template_path)
+        if template is None:
+            template = self._template_cache.setdefault(
+                template_path, self._get_env().get_template(template_path)
+            )
         return template.render(**variables)
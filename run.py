@@ -10,7 +10,6 @@ inputs.
 from __future__ import annotations
 
 import json
-import re
 from pathlib import Path
 from typing import Any
 
@@ -21,7 +20,17 @@ BASE_DIR = Path(__file__).resolve().parent
 PIPELINES_DIR = BASE_DIR / "pipelines"
 TEMPLATES_DIR = BASE_DIR / "templates"
 
-SLUG_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+# Letters, digits, hyphen, and underscore; a plain set-membership check keeps
+# the (startup-relevant) re import and pattern compilation out of this script.
+_SLUG_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-"
+)
+
+
+def _valid_slug(slug: str) -> bool:
+    """Return True when the identifier only uses filename-safe characters."""
+
+    return bool(slug) and not (set(slug) - _SLUG_CHARS)
 
 
 def _prompt(message: str, *, default: str | None = None) -> str:
@@ -117,7 +126,7 @@ def _create_project() -> None:
         slug = _prompt(
             "Project identifier (letters, numbers, hyphen, underscore)",
         )
-        if not SLUG_PATTERN.match(slug):
+        if not _valid_slug(slug):
             print("Identifiers may only include letters, numbers, hyphens, and underscores.")
             continue
         pipeline_path = PIPELINES_DIR / f"{slug}.json"
@@ -220,7 +229,7 @@ def _open_existing_project() -> None:
                 print("Number out of range. Try again.")
                 continue
             chosen = pipelines[index]
-            pipeline_def = loader.load(chosen["path"])
+            pipeline_def = chosen["definition"]
             label = chosen.get("name")
             break
 
